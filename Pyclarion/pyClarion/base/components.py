@@ -7,7 +7,7 @@ __all__ = [
 
 
 from .symbols import (
-    ConstructType, Symbol, SymbolicAddress, feature, expand_address, dims
+    ConstructType, Symbol, SymbolicAddress, feature, expand_address
 )
 from .. import numdicts as nd
 
@@ -28,14 +28,20 @@ Pt = TypeVar("Pt", bound="Process")
 class Process(object):
     """A basic component process."""
 
+    __slots__ = ("_client", "_expected", "_expected_cache", "_expected_set")
+
     _serves: ClassVar[ConstructType] = ConstructType.null_construct
 
     _client: Tuple[Symbol, ...]
     _expected: Tuple[SymbolicAddress, ...]
+    _expected_cache: Optional[Tuple[SymbolicAddress, ...]]
+    _expected_set: FrozenSet[SymbolicAddress]
 
     def __init__(self, expected: Sequence[SymbolicAddress] = None) -> None:
 
         self._expected = tuple(expected or ())
+        self._expected_cache = None
+        self._expected_set = frozenset()
         self._client = ()
 
     def __call__(self, inputs: Mapping[Any, nd.NumDict]) -> nd.NumDict:
@@ -58,7 +64,15 @@ class Process(object):
     def expected(self) -> Tuple[SymbolicAddress, ...]:
         """Constructs from which self expects to receive activations."""
 
-        return tuple(expand_address(self.client, x) for x in self._expected)
+        # Expanded addresses only depend on the client, so they are computed 
+        # once and reset on calls to entrust().
+        if self._expected_cache is None:
+            self._expected_cache = tuple(
+                expand_address(self.client, x) for x in self._expected
+            )
+            self._expected_set = frozenset(self._expected_cache)
+
+        return self._expected_cache
 
     def entrust(self, path: Tuple[Symbol, ...]) -> None:
         """Entrust handling of construct to self."""
@@ -66,6 +80,7 @@ class Process(object):
         parent, construct = path[:-1], path[-1]
         if construct.ctype in type(self)._serves:
             self._client = path
+            self._expected_cache = None
         else:
             msg = "{} cannot serve constructs of type {}."
             name, ctype = type(self).__name__, repr(construct.ctype) 
@@ -74,17 +89,23 @@ class Process(object):
     def check_inputs(self, inputs: Mapping[Any, nd.NumDict]) -> None:
         """Raise a RuntimeError if not all expected inputs are found."""
 
-        for path in self.expected:
-            if path not in inputs:
-                msg = "Missing expected input from {}."
-                raise RuntimeError(msg.format(path))
+        expected = self.expected
+        if not inputs.keys() >= self._expected_set:
+            path = next(path for path in expected if path not in inputs)
+            msg = "Missing expected input from {}."
+            raise RuntimeError(msg.format(path))
 
     def extract_inputs(
         self, inputs: Mapping[Any, nd.NumDict]
     ) -> Tuple[nd.NumDict, ...]:
 
-        self.check_inputs(inputs)
-        extracted = tuple(inputs[path] for path in self.expected)
+        # Inputs are looked up once; validation runs only on failure to 
+        # produce an informative error.
+        try:
+            extracted = tuple(inputs[path] for path in self.expected)
+        except KeyError:
+            self.check_inputs(inputs)
+            raise
 
         return extracted
 
@@ -95,7 +116,7 @@ class Process(object):
         :param inputs: Pairs the names of input constructs with their outputs. 
         """
 
-        return nd.NumDict(default=0)
+        return nd.NumDict.empty(default=0.0)
 
     def emit(self, data: nd.D = None) -> nd.NumDict:
         """
@@ -108,7 +129,7 @@ class Process(object):
         """
         
         if data is None:
-            return nd.NumDict(default=0.0)
+            return nd.NumDict.empty(default=0.0)
         elif data.default != 0:
             msg = "Unexpected default passed to {}."
             raise ValueError(msg.format(type(self).__name__))
@@ -119,9 +140,40 @@ class Process(object):
             msg = "Expected NumDict instance, got {}"
             raise TypeError(msg.format(type(data).__name__))
 
+    def _specialize(self) -> Callable[[Mapping[Any, nd.NumDict]], nd.NumDict]:
+        """
+        Return a function equivalent to self.__call__ for repeated use.
+
+        Method lookups are resolved once, and, unless emit() is overridden, 
+        common-case emission is inlined. The result reflects self at the time 
+        of the call; it should be rebuilt if self's methods are replaced.
+        """
+
+        if type(self).__call__ is not Process.__call__:
+            return self.__call__
+
+        call, emit = self.call, self.emit
+        if type(self).emit is not Process.emit:
+            def forward(inputs):
+                return emit(call(inputs))
+        else:
+            NumDict, squeeze = nd.NumDict, nd.squeeze
+            def forward(inputs):
+                data = call(inputs)
+                if isinstance(data, NumDict) and data.default == 0:
+                    return squeeze(data)
+                return emit(data) # handles None and raises on bad data
+        
+        return forward
+
 
 class Composite(Process, Generic[Pt]):
     """A component process built on top of an existing process."""
+
+    __slots__ = ("_base", "_expected_top", "_expected_top_cache")
+
+    _expected_top: Tuple[SymbolicAddress, ...]
+    _expected_top_cache: Optional[Tuple[SymbolicAddress, ...]]
     
     def __init__(
         self, base: Pt, expected: Sequence[SymbolicAddress] = None
@@ -132,6 +184,7 @@ class Composite(Process, Generic[Pt]):
         super().__init__(expected=_expected + base._expected)
 
         self._expected_top = _expected
+        self._expected_top_cache = None
         self._base = base
 
     @property
@@ -163,17 +216,26 @@ class Composite(Process, Generic[Pt]):
     def expected_top(self) -> Tuple[SymbolicAddress, ...]:
         """Input constructs expected exclusively by the top of the composite."""
 
-        return tuple(expand_address(self.client, x) for x in self._expected_top)
+        if self._expected_top_cache is None:
+            self._expected_top_cache = tuple(
+                expand_address(self.client, x) for x in self._expected_top
+            )
+
+        return self._expected_top_cache
 
     def entrust(self, path: Tuple[Symbol, ...]) -> None:
         """Entrust handling of construct to self."""
 
         self.base.entrust(path)
+        self._expected_cache = None
+        self._expected_top_cache = None
 
 
 class Wrapped(Composite[Pt]):
     """A Process wrapped by a pre- and/or post- processor."""
 
+    __slots__ = ()
+
     def call(self, inputs: Mapping[Any, nd.NumDict]) -> nd.NumDict:
         """
         Compute base construct's output.
@@ -246,6 +308,7 @@ class Domain(object):
     """if '_locked' is true, users cannot change domain at all"""
 
     _features: Tuple[feature, ...]
+    _feature_set: FrozenSet[feature]
 
     def __init__(self, features: Tuple[feature, ...]) -> None:
         """
@@ -254,21 +317,34 @@ class Domain(object):
         :param features: Features belongning to the domain.
         """
 
-        fset = set(features)
+        fset = frozenset(features)
         if len(fset) < len(features):
             raise ValueError("Features may not contain duplicates.")
-        if len(dims(fset)) != len(list(k for k, g in groupby(dims(features)))):
-            raise ValueError("Features must be grouped by dimension.")
+        seen: Set[Tuple[Hashable, int]] = set()
+        for d, _ in groupby(f.dim for f in features):
+            if d in seen:
+                raise ValueError("Features must be grouped by dimension.")
+            seen.add(d)
 
         self._features = features
+        self._feature_set = fset
 
     def __setattr__(self, name, value):
-        """ignore if name is no in _config"""
+        """Route writes to attributes named in _config to _set_monitored()."""
 
-        if name in type(self)._config and self._locked:
+        # Unmonitored (e.g., internal) writes cost a single membership test.
+        if name in type(self)._config:
+            self._set_monitored(name, value)
+        else:
+            object.__setattr__(self, name, value)
+
+    def _set_monitored(self, name: str, value: Any) -> None:
+        """Set a monitored attribute, respecting lock and config blocks."""
+
+        if self._locked:
             raise RuntimeError("Cannot mutate locked domain.")
-        super().__setattr__(name, value)
-        if not self._blocked and name in type(self)._config:
+        object.__setattr__(self, name, value)
+        if not self._blocked:
             self.update()
 
     @property
@@ -320,9 +396,7 @@ class Domain(object):
             """
             return True
 
-        s = set.intersection(*(set(dom.features) for dom in domains))
-
-        return s == set()
+        return not frozenset.intersection(*(d._feature_set for d in domains))
 
     # TO DO: add set operation?
 
@@ -353,18 +427,17 @@ class Interface(Domain):
 
         # TODO: Enforce fuzzy datatype for cmds when datatype markers are added.
 
-        if dims(set(cmds)) & dims(set(params)):
-            raise ValueError("Cmds and params may not share dims.")
-        if dims(set(cmds)) & dims(set(flags)):
-            raise ValueError("Cmds and flags may not share dims.")
-        if dims(set(cmds)) & dims(set(extras)):
-            raise ValueError("Cmds and extras may not share dims.")
-        if dims(set(params)) & dims(set(flags)):
-            raise ValueError("Params and flags may not share dims.")
-        if dims(set(params)) & dims(set(extras)):
-            raise ValueError("Params and extras may not share dims.")
-        if dims(set(flags)) & dims(set(extras)):
-            raise ValueError("Flags and extras may not share dims.")
+        groups = (
+            ("cmds", cmds), ("params", params), ("flags", flags), 
+            ("extras", extras)
+        )
+        group_of: Dict[Tuple[Hashable, int], str] = {}
+        for grp, fs in groups:
+            for f in fs:
+                prev = group_of.setdefault(f.dim, grp)
+                if prev != grp:
+                    msg = "{} and {} may not share dims."
+                    raise ValueError(msg.format(prev.capitalize(), grp))
 
         super().__init__(features=(cmds + params + flags + extras))
 
@@ -376,6 +449,10 @@ class Interface(Domain):
         key = feature.dim.fget # type: ignore
         self._defaults = tuple(next(g) for k, g in groupby(self.cmds, key))
 
+        # Lookup tables for parse_commands().
+        self._cmds_set = frozenset(cmds)
+        self._cmd_dim_to_idx = {f.dim: i for i, f in enumerate(self._defaults)}
+
     @property
     def cmds(self) -> Tuple[feature, ...]:
         """Interface commands."""
@@ -421,18 +498,17 @@ class Interface(Domain):
             raise ValueError("Unexpected default strength.")
 
         data = nd.squeeze(data)
-        data = nd.keep(data, keys=self.cmds)
+        data = nd.keep(data, keys=self._cmds_set)
         if any(v != 1.0 for v in data.values()):
             raise ValueError("Encountered non-integral cmd strength.")
 
         cmds = tuple(f for f in self.cmds if f in data)
-        if len(cmds) > len(set(dims(self.cmds))):
+        if len(cmds) > len(self._cmd_dim_to_idx):
             raise ValueError("Encountered multiple values from a single dim.")
 
         parse = list(self.defaults)
-        cmd_dims = dims(parse)
+        cmd_dim_to_idx = self._cmd_dim_to_idx
         for cmd in cmds:
-            i = cmd_dims.index(cmd.dim)
-            parse[i] = cmd
+            parse[cmd_dim_to_idx[cmd.dim]] = cmd
 
         return tuple(parse)
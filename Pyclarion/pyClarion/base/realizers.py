@@ -12,11 +12,11 @@ from itertools import combinations, chain
 from abc import abstractmethod
 from types import MappingProxyType
 from contextlib import nullcontext
-from contextvars import ContextVar
 from typing import (
     TypeVar, Union, Tuple, Dict, Callable, Hashable, Generic, Any, Optional, 
     Text, Iterator, Iterable, Mapping, ClassVar, List, ContextManager, cast
 )
+import threading
 import logging
 
 
@@ -28,10 +28,32 @@ PullFuncs = Mapping[Symbol, PullFunc]
 StructureItem = Tuple[Symbol, "Realizer"]
 
 
-# Context variables for agent construction. Helps track items to be added to 
-# structures. 
-BUILD_CTX: ContextVar[Tuple[Symbol, ...]] = ContextVar("BUILD_CTX", default=())
-BUILD_LIST: ContextVar[List["Realizer"]] = ContextVar("BUILD_LIST")
+BuildFrame = Tuple[Tuple[Symbol, ...], List["Realizer"]]
+
+
+class _BuildStack(threading.local):
+    """
+    Thread-local stack tracking structures under construction.
+
+    Each frame pairs the symbolic path of a structure being populated with a 
+    list of realizers to be added to it.
+    """
+
+    frames: List[BuildFrame]
+
+    def __init__(self) -> None:
+
+        self.frames = []
+
+    def top(self) -> Optional[BuildFrame]:
+        """Return the innermost frame, or None if the stack is empty."""
+
+        frames = self.frames
+        return frames[-1] if frames else None
+
+
+# Stack for agent construction. Helps track items to be added to structures.
+BUILD_STACK = _BuildStack()
 
 
 class Realizer(Generic[Ot]):
@@ -42,6 +64,8 @@ class Realizer(Generic[Ot]):
     information across construct networks.  
     """
 
+    __slots__ = ("_name", "_parent", "_inputs", "_inputs_proxy")
+
     _parent: Tuple[Symbol, ...]
     _inputs: Dict[Tuple[Symbol, ...], PullFunc]
 
@@ -53,16 +77,14 @@ class Realizer(Generic[Ot]):
         """
 
         self._validate_name(name)
-        self._log_init(name)
+        frame = BUILD_STACK.top()
+        self._log_init(name, frame)
 
-        try:
-            self._parent = BUILD_CTX.get()
-        except LookupError:
-            self._parent = ()
+        self._parent = frame[0] if frame is not None else ()
         self._name = name
         self._inputs = {}
         self._inputs_proxy = MappingProxyType(self._inputs)
-        self._update_add_queue()
+        self._update_add_queue(frame)
 
     def __repr__(self) -> Text:
 
@@ -110,27 +132,21 @@ class Realizer(Generic[Ot]):
 
         raise NotImplementedError()
 
-    def _update_add_queue(self) -> None:
+    def _update_add_queue(self, frame: Optional[BuildFrame]) -> None:
         """If current context contains an add queue, add self to it."""
 
-        try:
-            lst = BUILD_LIST.get()
-        except LookupError:
-            pass
-        else:
-            lst.append(self)
+        if frame is not None:
+            frame[1].append(self)
 
-    def _log_init(self, construct) -> None:
+    def _log_init(self, construct, frame: Optional[BuildFrame]) -> None:
 
         tname = type(self).__name__
-        try:
-            context = BUILD_CTX.get()
-        except LookupError:
+        if frame is not None:
+            msg = "Initializing %s %s in %s."
+            logging.debug(msg, tname, construct, frame[0])
+        else:
             msg = "Initializing %s %s."
             logging.debug(msg, tname, construct)
-        else:
-            msg = "Initializing %s %s in %s."
-            logging.debug(msg, tname, construct, context)
 
     @staticmethod
     def _validate_name(name) -> None:
@@ -149,7 +165,11 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
     short term memory buffers and so on.
     """
 
+    __slots__ = ("_output", "_process", "_forward", "_links")
+
     _process: Pt
+    _forward: Callable[[Mapping[Any, nd.NumDict]], nd.NumDict]
+    _links: Tuple[Tuple[Tuple[Symbol, ...], PullFunc], ...]
 
     def __init__(self, name: Symbol, process: Pt) -> None:
         """
@@ -160,6 +180,7 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
         """
 
         super().__init__(name=name)
+        self._links = ()
         self._output = process.emit()
         self.process = process
 
@@ -174,10 +195,11 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
 
         process.entrust(self.path)
         self._process = process
+        self._forward = process._specialize()
 
     def step(self) -> None:
 
-        self.output = self.process(self._pull())
+        self.output = self._forward(self._pull())
 
     @property
     def output(self) -> nd.NumDict:
@@ -206,10 +228,11 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
 
         logging.debug("Connecting %s to %s.", path, self.path)
         self._inputs[path] = callback
+        self._links = tuple(self._inputs.items())
 
     def _pull(self) -> Mapping[Tuple[Symbol, ...], nd.NumDict]:
 
-        return {src: ask() for src, ask in self.inputs.items()}
+        return {src: ask() for src, ask in self._links}
 
         
 class Structure(Realizer[Mapping[Any, nd.NumDict]]):
@@ -229,7 +252,13 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
 
     # TODO: Deep nesting needs testing. - Can
 
+    __slots__ = (
+        "_dict", "_dict_proxy", "_step_order", "_output_layout", "assets"
+    )
+
     _dict: Dict[Symbol, Realizer]
+    _step_order: Tuple[Realizer, ...]
+    _output_layout: Tuple[Tuple[SymbolicAddress, Construct], ...]
     _assets: Any
 
     def __init__(self, name: Symbol, assets: Any = None) -> None:
@@ -245,6 +274,8 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
         
         self._dict = {}
         self._dict_proxy = MappingProxyType(self._dict)
+        self._step_order = ()
+        self._output_layout = ()
         self.assets = assets if assets is not None else Assets()
 
     def __contains__(self, key: SymbolicAddress) -> bool:
@@ -257,8 +288,7 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
 
     def __iter__(self) -> Iterator[Symbol]:
 
-        for construct in self._dict:
-            yield construct
+        return iter(self._dict)
 
     def __getitem__(self, key: SymbolicAddress) -> Any:
 
@@ -279,42 +309,32 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
         logging.debug("Entering context %s.", self.name)
         if 0 < len(self._dict): # This could probably be relaxed.
             raise RuntimeError("Structure already populated.")
-        parent = BUILD_CTX.get() # default is ()
+        frame = BUILD_STACK.top()
+        parent = frame[0] if frame is not None else ()
         if 1 < len(parent): # See _upate_links() for rationale.
             raise RuntimeError("Maximum structure nesting depth (2) exceeded.") 
-        self._build_ctx_token = BUILD_CTX.set(parent + (self.name,))
-        self._build_list_token = BUILD_LIST.set([])
+        BUILD_STACK.frames.append((parent + (self.name,), []))
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
 
+        frames = BUILD_STACK.frames
         try: # Populate structure
             if exc_type is None:
-                context, add_list = BUILD_CTX.get(), BUILD_LIST.get()
+                context, add_list = frames[-1]
                 self._add(*add_list)
                 if len(context) <= 1:
                     assert len(context) != 0
                     self._weave()
         finally:
             logging.debug("Exiting context %s.", self.name)
-            BUILD_CTX.reset(self._build_ctx_token)
-            BUILD_LIST.reset(self._build_list_token)
+            frames.pop()
 
     @property
     def output(self) -> Mapping[Any, nd.NumDict]:
 
-        key: SymbolicAddress
-        output, split = {}, len(self.path)
-        for r in self._leaves():
-            tail = r.path[split:]
-            if len(tail) == 1:
-                key, = tail
-            else:
-                key = tail
-            output[key] = r.output
-
-        return output
+        return {key: r.output for key, r in self._output_layout}
 
     @output.deleter
     def output(self) -> None:
@@ -334,8 +354,9 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
         """
 
         # The stepping order is correct b/c in Python 3.7 and above, dictionary 
-        # iteration returns values in insertion order. 
-        for realizer in self._dict.values():
+        # iteration returns values in insertion order; self._step_order is a 
+        # flattened snapshot of this order taken at assembly time. 
+        for realizer in self._step_order:
             realizer.step()
 
     def _add(self, *realizers: Realizer) -> None:
@@ -344,6 +365,41 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
         for realizer in realizers:
             logging.debug("Adding %s to %s.", realizer.name, self.path)
             self._dict[realizer.name] = realizer       
+        self._update_step_order()
+        self._update_output_layout()
+
+    def _update_step_order(self) -> None:
+        """
+        Record the order in which self.step() visits constructs.
+
+        Member structures that do not customize step() are flattened into 
+        their own step order, so that stepping self need not recurse.
+        """
+
+        order: List[Realizer] = []
+        for realizer in self._dict.values():
+            if (
+                isinstance(realizer, Structure) and
+                type(realizer).step is Structure.step
+            ):
+                order.extend(realizer._step_order)
+            else:
+                order.append(realizer)
+        self._step_order = tuple(order)
+
+    def _update_output_layout(self) -> None:
+        """Record the output key of each Construct instance in self."""
+
+        key: SymbolicAddress
+        layout, split = [], len(self.path)
+        for r in self._leaves():
+            tail = r.path[split:]
+            if len(tail) == 1:
+                key, = tail
+            else:
+                key = tail
+            layout.append((key, r))
+        self._output_layout = tuple(layout)
 
     def _leaves(self) -> Iterator[Construct]:
         """Iterate over all Construct instances in self."""
@@ -359,15 +415,20 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
     def _weave(self) -> None:
         """Link all constructs in self."""
 
+        # Many constructs share inputs, so each path is resolved only once.
+        resolved: Dict[Tuple[Symbol, ...], PullFunc] = {}
         split = len(self.path)
         for realizer in self._leaves():
             for path in realizer.process.expected:
-                head, tail = path[:split], path[split:] 
-                if head != self.path:
-                    raise ValueError("Unexpected path.")
                 try:
-                    view = self[tail].view
-                except KeyError as e:
-                    raise RuntimeError("Missing construct") from e
-                else:
-                    realizer._link(path, view)
+                    view = resolved[path]
+                except KeyError:
+                    head, tail = path[:split], path[split:] 
+                    if head != self.path:
+                        raise ValueError("Unexpected path.")
+                    try:
+                        view = self[tail].view
+                    except KeyError as e:
+                        raise RuntimeError("Missing construct") from e
+                    resolved[path] = view
+                realizer._link(path, view)
@@ -103,17 +103,20 @@ class Token(object):
     support mutation.
     """
 
-    __slots__ = ("_args")
+    __slots__ = ("_args", "_hash")
 
     _args: Tuple[Hashable, ...]
+    _hash: int
 
     def __init__(self, *args: Hashable) -> None:
 
-        super().__setattr__("_args", tuple(args))
+        _args = tuple(args)
+        super().__setattr__("_args", _args)
+        super().__setattr__("_hash", hash(_args))
 
     def __hash__(self) -> int:
 
-        return hash(self._args)
+        return self._hash
 
     def __repr__(self) -> str:
 
@@ -131,8 +134,10 @@ class Token(object):
 
     def __eq__(self, other) -> bool:
 
-        if isinstance(other, Token):
-            return self._args == other._args
+        if self is other:
+            return True
+        elif isinstance(other, Token):
+            return self._hash == other._hash and self._args == other._args
         else:
             return NotImplemented
 
@@ -194,6 +199,42 @@ class Symbol(Token):
         return self._args[1] 
 
 
+class _InternedSymbol(Symbol):
+    """
+    A symbol whose instances are interned.
+
+    Repeated construction with the same identifier returns the same instance, 
+    so that equality tests and hashing in address lookups are cheap. Intended 
+    for construct-level symbols, of which there are few.
+    """
+
+    __slots__ = ()
+
+    _interned: Dict[Hashable, "_InternedSymbol"] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
+    def __new__(cls, cid: Hashable) -> "_InternedSymbol":
+
+        try:
+            return cls._interned[cid]
+        except KeyError:
+            return cls._interned.setdefault(cid, super().__new__(cls))
+
+    def __init__(
+        self, ctype: Union[ConstructType, str, int], cid: Hashable
+    ) -> None:
+
+        # Interned instances are initialized only once.
+        try:
+            self._args
+        except AttributeError:
+            super().__init__(ctype, cid)
+
+
 class feature(Symbol):
     """
     A feature symbol.
@@ -220,7 +261,9 @@ class feature(Symbol):
         :param lag: Lag indicator.
         """
 
-        super().__init__("feature", ((tag, lag), val))
+        # Features are created in large numbers, so construct type resolution 
+        # in Symbol.__init__() is skipped.
+        Token.__init__(self, ConstructType.feature, ((tag, lag), val))
 
     def __repr__(self) -> str:
 
@@ -240,25 +283,25 @@ class feature(Symbol):
     def dim(self):
         """Feature dimension, equal to (self.tag, self.lag)."""
 
-        return self.cid[0]
+        return self._args[1][0]
     
     @property
     def val(self):
         """Feature value."""
         
-        return self.cid[1]
+        return self._args[1][1]
 
     @property
     def tag(self):
         """Dimension tag."""
         
-        return self.cid[0][0]
+        return self._args[1][0][0]
 
     @property
     def lag(self):
         """Lag value."""
         
-        return self.cid[0][1]
+        return self._args[1][0][1]
 
 
 class chunk(Symbol):
@@ -291,7 +334,7 @@ class rule(Symbol):
         super().__init__("rule", cid)
 
 
-class features(Symbol):
+class features(_InternedSymbol):
     """A feature pool symbol."""
 
     __slots__ = ()
@@ -306,7 +349,7 @@ class features(Symbol):
         super().__init__("features", cid)
 
 
-class chunks(Symbol):
+class chunks(_InternedSymbol):
     """A chunk pool symbol."""
 
     __slots__ = ()
@@ -321,7 +364,7 @@ class chunks(Symbol):
         super().__init__("chunks", cid)
 
 
-class flow_in(Symbol):
+class flow_in(_InternedSymbol):
     """An input flow symbol."""
 
     __slots__ = ()
@@ -336,7 +379,7 @@ class flow_in(Symbol):
         super().__init__("flow_in", cid)
 
 
-class flow_bt(Symbol):
+class flow_bt(_InternedSymbol):
     """A bottom-up flow symbol."""
 
     __slots__ = ()
@@ -351,7 +394,7 @@ class flow_bt(Symbol):
         super().__init__("flow_bt", cid)
 
 
-class flow_tb(Symbol):
+class flow_tb(_InternedSymbol):
     """A top-down flow symbol."""
 
     __slots__ = ()
@@ -366,7 +409,7 @@ class flow_tb(Symbol):
         super().__init__("flow_tb", cid)
 
 
-class flow_tt(Symbol):
+class flow_tt(_InternedSymbol):
     """A top level flow symbol."""
 
     __slots__ = ()
@@ -381,7 +424,7 @@ class flow_tt(Symbol):
         super().__init__("flow_tt", cid)
 
 
-class flow_bb(Symbol):
+class flow_bb(_InternedSymbol):
     """A bottom level flow symbol."""
 
     __slots__ = ()
@@ -396,7 +439,7 @@ class flow_bb(Symbol):
         super().__init__("flow_bb", cid)
 
 
-class terminus(Symbol):
+class terminus(_InternedSymbol):
     """A terminus symbol."""
 
     __slots__ = ()
@@ -411,7 +454,7 @@ class terminus(Symbol):
         super().__init__("terminus", cid)
 
 
-class updater(Symbol):
+class updater(_InternedSymbol):
     """An updater symbol."""
 
     __slots__ = ()
@@ -426,7 +469,7 @@ class updater(Symbol):
         super().__init__("updater", cid)
 
 
-class buffer(Symbol):
+class buffer(_InternedSymbol):
     """A buffer symbol."""
 
     __slots__ = ()
@@ -441,7 +484,7 @@ class buffer(Symbol):
         super().__init__("buffer", cid)
 
 
-class subsystem(Symbol):
+class subsystem(_InternedSymbol):
     """A subsystem symbol."""
 
     __slots__ = ()
@@ -456,7 +499,7 @@ class subsystem(Symbol):
         super().__init__("subsystem", cid)
 
 
-class agent(Symbol):
+class agent(_InternedSymbol):
     """An agent symbol."""
 
     __slots__ = ()
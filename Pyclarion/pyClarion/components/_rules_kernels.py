@@ -0,0 +1,192 @@
+"""Numerical kernels for rule propagation over flattened rule tables."""
+
+
+# If numba is available, kernels are compiled to native code and rule tables
+# are stored as numpy arrays. Otherwise, kernels run in pure python over
+# tuples and lists.
+
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+import operator
+import random
+import math
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+
+# Minimum number of rules for which the parallel kernel is used. Below this, 
+# thread dispatch costs outweigh the gains.
+PARALLEL_THRESHOLD = 512
+
+
+def table(values: Iterable, dtype: str = "float") -> Sequence:
+    """Return a read-only table suitable for kernel consumption."""
+
+    if numba is None:
+        return tuple(values)
+    else:
+        arr = np.fromiter(values, dtype=np.int64 if dtype == "int" else float)
+        arr.flags.writeable = False
+        return arr
+
+
+def vector(values: Iterable[float]) -> Sequence[float]:
+    """Return a vector of floats suitable for kernel consumption."""
+
+    if numba is None:
+        return list(values)
+    else:
+        return np.fromiter(values, dtype=float)
+
+
+def _assoc_kernel(
+    s_vec: Sequence[float],
+    col_idx: Sequence[int],
+    w_data: Sequence[float],
+    rowptr: Sequence[int],
+    rule_concs: Sequence[int],
+    n_concs: int,
+    active: Optional[Sequence[int]]
+) -> Tuple[List[float], List[float]]:
+
+    get = s_vec.__getitem__
+    if active is None:
+        prods = list(map(operator.mul, map(get, col_idx), w_data))
+        rule_str = [sum(prods[a:b], 0.0) for a, b in zip(rowptr, rowptr[1:])]
+        concs: Sequence[int] = rule_concs
+    else:
+        rule_str = [
+            sum(map(
+                operator.mul, 
+                map(get, col_idx[rowptr[r]:rowptr[r + 1]]), 
+                w_data[rowptr[r]:rowptr[r + 1]]
+            ), 0.0) 
+            for r in active
+        ]
+        concs = [rule_concs[r] for r in active]
+
+    conc_str = [0.0] * n_concs
+    for c, s_r in zip(concs, rule_str):
+        if s_r > conc_str[c]:
+            conc_str[c] = s_r
+
+    return conc_str, rule_str
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _assoc_kernel_jit(
+        s_vec, col_idx, w_data, rowptr, rule_concs, n_concs, active
+    ):
+
+        out = np.zeros(n_concs)
+        rule_str = np.empty(len(active))
+        for i in range(len(active)):
+            r = active[i]
+            acc = 0.0
+            for k in range(rowptr[r], rowptr[r + 1]):
+                acc += s_vec[col_idx[k]] * w_data[k]
+            rule_str[i] = acc
+            c = rule_concs[r]
+            if acc > out[c]:
+                out[c] = acc
+
+        return out, rule_str
+
+    @numba.njit(parallel=True, cache=True)
+    def _assoc_kernel_par(
+        s_vec, col_idx, w_data, rowptr, rule_concs, n_concs, active
+    ):
+
+        rule_str = np.empty(len(active))
+        for i in numba.prange(len(active)):
+            r = active[i]
+            acc = 0.0
+            for k in range(rowptr[r], rowptr[r + 1]):
+                acc += s_vec[col_idx[k]] * w_data[k]
+            rule_str[i] = acc
+
+        # Serial max-reduction over conclusions avoids write conflicts.
+        out = np.zeros(n_concs)
+        for i in range(len(active)):
+            c = rule_concs[active[i]]
+            if rule_str[i] > out[c]:
+                out[c] = rule_str[i]
+
+        return out, rule_str
+
+
+def assoc_kernel(
+    s_vec: Sequence[float],
+    col_idx: Sequence[int],
+    w_data: Sequence[float],
+    rowptr: Sequence[int],
+    rule_concs: Sequence[int],
+    n_concs: int,
+    active: Sequence[int] = None
+) -> Tuple[Sequence[float], Sequence[float]]:
+    """
+    Compute associative rule strengths from flattened rule tables.
+
+    Rule strengths are weighted sums of condition strengths; conclusion
+    strengths are the maximum of 0 and the strengths of rules concluding them.
+
+    Returns a pair (conc_str, rule_str), where rule_str[i] is the strength of 
+    rule active[i], or of rule i if active is None.
+
+    :param s_vec: Condition strengths, indexed by condition.
+    :param col_idx: Condition index of each rule condition entry.
+    :param w_data: Weight of each rule condition entry.
+    :param rowptr: Rule i owns entries rowptr[i] through rowptr[i + 1].
+    :param rule_concs: Conclusion index of each rule.
+    :param n_concs: Number of distinct conclusions.
+    :param active: Optional indices of the rules to evaluate. Other rules are 
+        treated as having strength 0.
+
+    When numba is available and more than PARALLEL_THRESHOLD rules are 
+    evaluated, work is spread across threads.
+    """
+
+    if numba is None:
+        return _assoc_kernel(
+            s_vec, col_idx, w_data, rowptr, rule_concs, n_concs, active
+        )
+    else:
+        if active is None:
+            active = np.arange(len(rowptr) - 1)
+        if len(active) > PARALLEL_THRESHOLD:
+            kernel = _assoc_kernel_par
+        else:
+            kernel = _assoc_kernel_jit
+        return kernel(
+            s_vec, col_idx, w_data, rowptr, rule_concs, n_concs, active
+        )
+
+
+def boltzmann_choice(values: Sequence[float], t: float) -> int:
+    """
+    Draw an index into values from a boltzmann distribution with temperature t.
+
+    Sampling uses the random module, so results respect random.seed(). If 
+    values has a single element, no random number is consumed.
+
+    :param values: A non-empty sequence of values.
+    :param t: Temperature.
+    """
+
+    if len(values) == 1:
+        return 0
+
+    m = max(values)
+    if numba is None:
+        weights = [math.exp((v - m) / t) for v in values]
+    else:
+        weights = np.exp((np.asarray(values) - m) / t)
+    i, = random.choices(range(len(values)), weights=weights)
+
+    return i
@@ -29,6 +29,7 @@ from copy import copy
 from dataclasses import dataclass
 from types import MappingProxyType
 import operator
+import weakref
 
 
 class Chunk(object):
@@ -38,7 +39,19 @@ class Chunk(object):
     Specifies features and dimensional weights.
     """
 
-    __slots__ = ("_features", "_weights")
+    __slots__ = (
+        "_features", "_weights", "_dims", "_dim_features", "_dim_weights", 
+        "_weight_total", "_feature_order", "_feature_weight_vec", 
+        "_bottom_up_cache"
+    )
+
+    _dims: Tuple[Tuple[Hashable, int], ...]
+    _dim_features: Tuple[Tuple[feature, ...], ...]
+    _dim_weights: Tuple[float, ...]
+    _weight_total: float
+    _feature_order: Tuple[feature, ...]
+    _feature_weight_vec: Tuple[float, ...]
+    _bottom_up_cache: Optional[Tuple["weakref.ref[nd.NumDict]", float]]
 
     def __init__(
         self, 
@@ -56,7 +69,27 @@ class Chunk(object):
         assert set(ws) == dims
 
         self._features = frozenset(features)
-        self._weights = ws
+        self._weights = nd.freeze(ws)
+        self._bottom_up_cache = None
+        self._build_layout()
+
+    def _build_layout(self) -> None:
+        """Precompute per-dimension tables used by top_down and bottom_up."""
+
+        by_dim: Dict[Tuple[Hashable, int], List[feature]] = {}
+        for f in self._features:
+            by_dim.setdefault(f.dim, []).append(f)
+
+        ws = self._weights
+        self._dims = tuple(by_dim)
+        self._dim_features = tuple(tuple(fs) for fs in by_dim.values())
+        self._dim_weights = tuple(ws[dim] for dim in self._dims)
+        self._weight_total = sum(self._dim_weights, 0.0)
+        self._feature_order = tuple(chain.from_iterable(self._dim_features))
+        self._feature_weight_vec = tuple(
+            w for fs, w in zip(self._dim_features, self._dim_weights) 
+            for _ in fs
+        )
 
     def __repr__(self) -> str:
 
@@ -116,13 +149,11 @@ class Chunk(object):
         Implementation is based on p. 77-78 of Anatomy of the Mind.
         """
 
-        weighted = strength * self.weights
-
-        d = nd.MutableNumDict(default=0.0)
-        d.extend(self.features)
-        d.set_by(weighted, feature.dim.fget) # type: ignore 
-
-        return d
+        return nd.MutableNumDict.from_sequences(
+            self._feature_order, 
+            [strength * w for w in self._feature_weight_vec], 
+            default=0.0
+        )
 
     def bottom_up(self, strengths: nd.NumDict) -> float:
         """
@@ -134,12 +165,33 @@ class Chunk(object):
 
         Implementation is based on p. 77-78 of Anatomy of the Mind. However, 
         no nonlinearity is included in the denominator of the equation.
+
+        The result for the most recent frozen strengths argument is cached, as 
+        the same strengths are often presented repeatedly.
         """
 
-        d = nd.keep(strengths, keys=self.features)
-        d = nd.max_by(d, keyfunc=feature.dim.fget) # type: ignore 
-        weighted = d * self.weights 
-        strength = nd.val_sum(weighted) / nd.val_sum(self.weights)
+        frozen = type(strengths) is nd.NumDict
+        if frozen and self._bottom_up_cache is not None:
+            ref, cached = self._bottom_up_cache
+            if ref() is strengths:
+                return cached
+
+        # Dimensions w/o explicitly active features take the default strength.
+        default = strengths.default
+        total = 0.0
+        layout = zip(self._dims, self._dim_features, self._dim_weights)
+        for dim, fs, w in layout:
+            vals = [strengths[f] for f in fs if f in strengths]
+            if vals:
+                total += w * max(vals)
+            elif default is not None:
+                total += w * default
+            else:
+                raise KeyError(dim)
+        strength = total / self._weight_total
+
+        if frozen:
+            self._bottom_up_cache = (weakref.ref(strengths), strength)
 
         return strength
 
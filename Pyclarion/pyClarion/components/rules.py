@@ -7,20 +7,24 @@ __all__ = ["Rule", "Rules", "AssociativeRules", "ActionRules"]
 from ..base.symbols import ConstructType, Symbol, rule, chunk
 from ..base.components import Process
 from .chunks_ import Chunks
+from . import _rules_kernels as kernels
 from .. import numdicts as nd
 
 from typing import (
     Mapping, MutableMapping, TypeVar, Generic, Type, Dict, FrozenSet, Set, 
-    Tuple, overload, cast, Any, Iterator, Sequence, Union
+    Tuple, List, Optional, ClassVar, overload, cast, Any, Iterator, Sequence, 
+    Union, NamedTuple
 )
 from contextlib import contextmanager
 from types import MappingProxyType
+import operator
+import math
 
 
 class Rule(object):
     """Represents a rule form."""
 
-    __slots__ = ("_conc", "_weights")
+    __slots__ = ("_conc", "_weights", "_cond_keys", "_w_vec", "_cond_set")
 
     def __init__(
         self, conc: chunk, *conds: chunk, weights: Dict[chunk, float] = None
@@ -49,19 +53,46 @@ class Rule(object):
             if not all(0 < v for v in weights.values()):
                 ValueError("Weights must be strictly positive.")
 
-        ws = nd.MutableNumDict(weights)
-        ws.extend(conds, value=1.0)
+        ws = dict(weights) if weights is not None else {}
+        for c in conds:
+            ws.setdefault(c, 1.0)
 
-        w_sum = nd.val_sum(ws)
+        w_sum = sum(ws.values())
         if w_sum > 1.0: 
-            ws /= w_sum
+            ws = {c: w / w_sum for c, w in ws.items()}
 
         self._conc = conc
-        self._weights = nd.freeze(ws)
+        self._weights = nd.NumDict(ws)
+
+        # Parallel condition and weight sequences for computing strengths 
+        # without building intermediate numdicts.
+        self._cond_keys = tuple(self._weights)
+        self._w_vec = tuple(self._weights[c] for c in self._cond_keys)
+        self._cond_set = frozenset(self._cond_keys)
 
         # postconditions
         assert set(self._weights) == set(conds), "Each cond must have a weight."
-        assert nd.val_sum(ws) <= 1, "Inferred weights must sum to one or less."
+        assert sum(self._w_vec) <= 1, "Inferred weights must sum to one or less."
+
+    @classmethod
+    def _probe(cls, conc: chunk, *conds: chunk) -> "Rule":
+        """
+        Return a lightweight stand-in for cls(conc, *conds).
+
+        The probe supports match() and comparison, but skips validation and 
+        weight normalization checks.
+        """
+
+        probe = cls.__new__(cls)
+        cond_keys = tuple(dict.fromkeys(conds))
+        w = 1.0 / len(cond_keys) if len(cond_keys) > 1 else 1.0
+        probe._conc = conc
+        probe._cond_keys = cond_keys
+        probe._w_vec = (w,) * len(cond_keys)
+        probe._cond_set = frozenset(cond_keys)
+        probe._weights = nd.NumDict.from_sequences(cond_keys, probe._w_vec)
+
+        return probe
 
     def __repr__(self) -> str:
 
@@ -70,14 +101,14 @@ class Rule(object):
     def __eq__(self, other) -> bool:
 
         if isinstance(other, Rule):
-            b = (
-                self.conc == other.conc and 
-                nd.isclose(self.weights, other.weights)
-            )
-            return b
+            return self.match(other)
         else:
             return NotImplemented
 
+    def __hash__(self) -> int:
+
+        return hash((self._conc, self._cond_set))
+
     @property
     def conc(self) -> chunk:
         """Conclusion of rule."""
@@ -91,11 +122,18 @@ class Rule(object):
         return self._weights
 
     def match(self, other: "Rule") -> bool:
-        """ If conclusion matches and numDict is close, return True"""
+        """
+        Return True iff self and other have the same conclusion and conditions 
+        and their condition weights are close.
+        """
 
         b = (
-            self.conc == other.conc
-            and nd.isclose(self.weights, other.weights)
+            self._conc == other._conc
+            and self._cond_set == other._cond_set
+            and all(
+                math.isclose(w, other._weights[c]) 
+                for c, w in zip(self._cond_keys, self._w_vec)
+            )
         )
 
         return b
@@ -110,9 +148,9 @@ class Rule(object):
         Implementation based on p. 60 and p. 73 of Anatomy of the Mind.
         """
 
-        weighted = nd.keep(strengths, keys=self.weights) * self.weights
+        s_vec = map(strengths.__getitem__, self._cond_keys)
         
-        return nd.val_sum(weighted)
+        return sum(map(operator.mul, s_vec, self._w_vec), 0.0)
 
     def support(self, *cdbs: Chunks) -> bool:
         """
@@ -128,9 +166,37 @@ class Rule(object):
 
 
 Rt = TypeVar("Rt", bound="Rule")
+# Rule forms are indexed by conclusion and condition set.
+FormKey = Tuple[chunk, FrozenSet[chunk]]
+
+
+class _RuleTables(NamedTuple):
+    """
+    Flattened rule database, as consumed by rule evaluation kernels.
+
+    Rule i has conditions conds[j] for j in 
+    col_idx[rowptr[i]:rowptr[i + 1]], with matching weights in w_data. Its 
+    symbol is rule_syms[i] and its conclusion is concs[rule_concs[i]]. Indices 
+    of rules conditioned on chunk c are listed in rules_by_cond[c].
+    """
+
+    conds: Tuple[chunk, ...]
+    cond_index: Mapping[chunk, int]
+    col_idx: Sequence[int]
+    w_data: Sequence[float]
+    rowptr: Sequence[int]
+    concs: Tuple[chunk, ...]
+    rule_concs: Sequence[int]
+    rule_syms: Tuple[rule, ...]
+    rules_by_cond: Mapping[chunk, Tuple[int, ...]]
+
+
 class Rules(MutableMapping[rule, Rt], Generic[Rt]):
     """A simple rule database."""
 
+    # Minimum number of promised deletions for step() to rebuild self._data.
+    _bulk_del_threshold: ClassVar[int] = 32
+
     @overload
     def __init__(self: "Rules[Rule]") -> None:
         ...
@@ -175,6 +241,10 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
         self._add_promises: MutableMapping[rule, Rt] = dict()
         self._del_promises: Set[rule] = set()
 
+        self._items_cache: Optional[Tuple[Tuple[rule, Rt], ...]] = None
+        self._forms_cache: Optional[Dict[FormKey, List[rule]]] = None
+        self._tables_cache: Optional[_RuleTables] = None
+
     def __repr__(self) -> str:
 
         repr_ = "{}({})".format(type(self).__name__, repr(self._data))
@@ -200,6 +270,7 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
                 msg = "Rule {} contains unexpected chunks."
                 raise ValueError(msg.format(key.cid))
             self._data[key] = val
+            self._invalidate()
         else:
             msg = "This rule database expects rules of type '{}'." 
             TypeError(msg.format(type(self.Rule.__name__)))
@@ -207,6 +278,19 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
     def __delitem__(self, key: Any) -> None:
 
         del self._data[key]
+        self._invalidate()
+
+    def stable_items(self) -> Tuple[Tuple[rule, Rt], ...]:
+        """
+        Return a snapshot of rule items as a tuple.
+        
+        The snapshot is cached until self is next modified.
+        """
+
+        if self._items_cache is None:
+            self._items_cache = tuple(self._data.items())
+
+        return self._items_cache
 
     @property
     def add_promises(self) -> Mapping[rule, Rt]:
@@ -251,11 +335,13 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
         if isinstance(obj, Rule):
             target = obj
         else:
-            target = Rule(*obj)
+            target = Rule._probe(*obj)
 
+        # Only rules sharing target's conclusion and conditions can match.
         rules = set()
-        for ch, form_ch in self.items():
-            if form_ch.match(target):
+        key = (target._conc, target._cond_set)
+        for ch in self._form_index().get(key, ()):
+            if self._data[ch].match(target):
                 rules.add(ch)
         if check_promises:
             for ch, form_ch in self._add_promises.items():
@@ -271,7 +357,10 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
         See Rule for details on rule forms.
         """
 
-        return any(form == entry for entry in self.values())
+        key = (form._conc, form._cond_set)
+        candidates = self._form_index().get(key, ())
+
+        return any(form == self._data[r] for r in candidates)
 
     @contextmanager
     def enforce_support(self, *cdbs: Chunks):
@@ -329,13 +418,103 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
     def step(self) -> None:
         """Apply any promised updates."""
 
-        for r in self._del_promises:
-            del self[r]
-        self._del_promises.clear()
+        # Promised rules removed in the meantime are an error on either path; 
+        # checking up front leaves self unchanged in that case.
+        dels = self._del_promises
+        missing = dels - self._data.keys()
+        if missing:
+            raise KeyError(next(iter(missing)))
+
+        # Large batches of deletions are applied by rebuilding the underlying 
+        # dict in one pass, which also keeps it compact.
+        if len(dels) >= self._bulk_del_threshold:
+            self._data = {k: v for k, v in self._data.items() if k not in dels}
+            self._invalidate()
+        else:
+            for r in dels:
+                del self[r]
+        dels.clear()
 
         self.update(self._add_promises)
         self._add_promises.clear()
 
+    def get_cond_layout(self) -> Tuple[Tuple[chunk, ...], Mapping[chunk, int]]:
+        """
+        Return the condition layout used to evaluate rules in self.
+
+        The layout is a pair (conds, index), where conds lists each condition 
+        chunk appearing in self exactly once and index maps each condition to 
+        its position in conds. Strength vectors aligned to conds can be fed 
+        directly to rule evaluation kernels. 
+        
+        The layout is recomputed after any change to self.
+        """
+
+        tables = self._tables()
+
+        return tables.conds, tables.cond_index
+
+    def _tables(self) -> _RuleTables:
+        """
+        Return flattened rule tables for self.
+        
+        Tables are rebuilt lazily after any change to self.
+        """
+
+        if self._tables_cache is None:
+            self._tables_cache = self._compile()
+
+        return self._tables_cache
+
+    def _compile(self) -> _RuleTables:
+        """Flatten rule forms into parallel condition and weight tables."""
+
+        cond_index: Dict[chunk, int] = {}
+        conc_index: Dict[chunk, int] = {}
+        col_idx: List[int] = []
+        w_data: List[float] = []
+        rowptr: List[int] = [0]
+        rule_concs: List[int] = []
+        rules_by_cond: Dict[chunk, List[int]] = {}
+        for i, (_, form) in enumerate(self.stable_items()):
+            for c, w in zip(form._cond_keys, form._w_vec):
+                col_idx.append(cond_index.setdefault(c, len(cond_index)))
+                w_data.append(w)
+                rules_by_cond.setdefault(c, []).append(i)
+            rowptr.append(len(col_idx))
+            rule_concs.append(conc_index.setdefault(form.conc, len(conc_index)))
+
+        return _RuleTables(
+            conds=tuple(cond_index),
+            cond_index=MappingProxyType(cond_index),
+            col_idx=kernels.table(col_idx, dtype="int"),
+            w_data=kernels.table(w_data),
+            rowptr=kernels.table(rowptr, dtype="int"),
+            concs=tuple(conc_index),
+            rule_concs=kernels.table(rule_concs, dtype="int"),
+            rule_syms=tuple(r for r, _ in self.stable_items()),
+            rules_by_cond={c: tuple(v) for c, v in rules_by_cond.items()}
+        )
+
+    def _form_index(self) -> Dict[FormKey, List[rule]]:
+        """Return a cached index of rule symbols by conclusion and conditions."""
+
+        if self._forms_cache is None:
+            index: Dict[FormKey, List[rule]] = {}
+            for r, form in self.stable_items():
+                key = (form._conc, form._cond_set)
+                index.setdefault(key, []).append(r)
+            self._forms_cache = index
+
+        return self._forms_cache
+
+    def _invalidate(self) -> None:
+        """Discard cached views of rule data."""
+
+        self._items_cache = None
+        self._forms_cache = None
+        self._tables_cache = None
+
     def _validate_rule_form(self, form):
 
         if self.max_conds is not None and len(form.weights) > self.max_conds:
@@ -346,6 +525,8 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
 class RuleDBUpdater(Process):
     """Applies requested updates to a client Rules instance."""
 
+    __slots__ = ("rules",)
+
     _serves = ConstructType.updater
 
     def __init__(self, rules: "Rules") -> None:
@@ -375,6 +556,8 @@ class AssociativeRules(Process):
     Implementation based on p. 73-74 of Anatomy of the Mind.
     """
 
+    __slots__ = ("rules",)
+
     _serves = ConstructType.flow_tt
 
     def __init__(self, source: Symbol, rules: Rules) -> None:
@@ -388,16 +571,42 @@ class AssociativeRules(Process):
 
         strengths, = self.extract_inputs(inputs)
 
-        d = nd.MutableNumDict(default=0.0)
-        for r, form in self.rules.items():
-            s_r = form.strength(strengths)
-            d[form.conc] = max(d[form.conc], s_r)
-            d[r] = s_r
-        d.squeeze()
+        t = self.rules._tables()
+        index = t.cond_index
+
+        if strengths.default == 0.0:
+            # Strengths are typically sparse. Only rules with some explicitly 
+            # active condition can have nonzero strength, so evaluate just 
+            # those. 
+            by_cond = t.rules_by_cond
+            s_list = [0.0] * len(index)
+            active: Set[int] = set()
+            for c, v in strengths.items():
+                if c in index:
+                    s_list[index[c]] = v
+                    active.update(by_cond[c])
+            s_vec = kernels.vector(s_list)
+            rule_idx = sorted(active)
+            conc_str, rule_str = kernels.assoc_kernel(
+                s_vec, t.col_idx, t.w_data, t.rowptr, t.rule_concs, 
+                len(t.concs), kernels.table(rule_idx, dtype="int")
+            )
+            rule_syms: Sequence[rule] = [t.rule_syms[i] for i in rule_idx]
+        else:
+            s_vec = kernels.vector(strengths[c] for c in t.conds)
+            conc_str, rule_str = kernels.assoc_kernel(
+                s_vec, t.col_idx, t.w_data, t.rowptr, t.rule_concs, 
+                len(t.concs)
+            )
+            rule_syms = t.rule_syms
 
-        assert d.default == 0, "Unexpected output default."
+        # Zero strengths are dropped up front, so no squeeze is needed.
+        data: Dict[Symbol, float] = {
+            k: v for k, v in zip(t.concs, conc_str) if v != 0.0
+        }
+        data.update((k, v) for k, v in zip(rule_syms, rule_str) if v != 0.0)
 
-        return d
+        return nd.NumDict(data, default=0.0)
 
 
 class ActionRules(Process):
@@ -410,6 +619,8 @@ class ActionRules(Process):
     propagated to its conclusion. 
     """
 
+    __slots__ = ("rules", "threshold", "temperature")
+
     _serves = ConstructType.flow_tt
 
     def __init__(
@@ -438,18 +649,20 @@ class ActionRules(Process):
             strengths, th=self.threshold, keep_default=True
         )
 
-        d = nd.MutableNumDict(default=0)
-        for r, form in self.rules.items():
-            d[r] = form.strength(strengths)
-        
-        probabilities = nd.boltzmann(d, self.temperature)
-        selection = nd.draw(probabilities, n=1)
+        t = self.rules._tables()
 
-        d *= selection
-        d.squeeze()
-        d.max(nd.transform_keys(d, func=lambda r: self.rules[r].conc))
-
-        # postcondition
-        assert d.default == 0, "Unexpected output default."
-
-        return d
+        data: Dict[Symbol, float] = {}
+        if len(t.rule_syms) > 0:
+            s_vec = kernels.vector(strengths[c] for c in t.conds)
+            _, rule_str = kernels.assoc_kernel(
+                s_vec, t.col_idx, t.w_data, t.rowptr, t.rule_concs, 
+                len(t.concs)
+            )
+            i = kernels.boltzmann_choice(rule_str, self.temperature)
+            s_r = rule_str[i]
+            if s_r != 0.0:
+                data[t.rule_syms[i]] = s_r
+            if s_r > 0.0:
+                data[t.concs[t.rule_concs[i]]] = s_r
+
+        return nd.NumDict(data, default=0.0)
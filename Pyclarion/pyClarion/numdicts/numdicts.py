@@ -17,7 +17,7 @@ from typing import (
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from itertools import chain
-from functools import wraps
+from functools import wraps, lru_cache
 import math
 import random
 import operator
@@ -414,7 +414,7 @@ class NumDict(Mapping[Any, float]):
     only succeed for explicit members.
     """
 
-    __slots__ = ("_dict", "_default")
+    __slots__ = ("_dict", "_default", "__weakref__")
 
     _dict: Dict[Any, float]
     _default: Optional[float]
@@ -443,6 +443,49 @@ class NumDict(Mapping[Any, float]):
 
         return self._default
 
+    @classmethod
+    def empty(cls: Type[D], default: Union[float, int] = None) -> D:
+        """
+        Return an empty numdict with the given default.
+
+        As NumDict instances are immutable, calls to NumDict.empty() with the 
+        same default share a single instance. Subclasses receive a new 
+        instance on each call.
+
+        :param default: Default value for keys not in the result.
+        """
+
+        if cls is NumDict:
+            _default = float(default) if default is not None else None
+            return cast(D, _empty_numdict(_default))
+        else:
+            return cls(default=default)
+
+    @classmethod
+    def from_sequences(
+        cls: Type[D], 
+        keys: Iterable[Any], 
+        values: Iterable[Union[float, int]], 
+        default: Union[float, int] = None
+    ) -> D:
+        """
+        Construct a new numdict from parallel sequences of keys and values.
+
+        Faster than the default constructor for data not already held in a 
+        mapping. If keys contains duplicates, the last value for each key is 
+        retained.
+
+        :param keys: Keys of the new numdict.
+        :param values: Values of the new numdict, aligned with keys.
+        :param default: Default value for keys not in the result.
+        """
+
+        d = cls.__new__(cls)
+        d._dict = dict(zip(keys, map(float, values)))
+        d._default = float(default) if default is not None else None
+
+        return d
+
     def __str__(self) -> str:
 
         fmtargs = type(self).__name__, str(self._dict), self._default
@@ -808,6 +851,12 @@ class NumDict(Mapping[Any, float]):
             return float("nan")
 
 
+@lru_cache(maxsize=32)
+def _empty_numdict(default: Optional[float]) -> NumDict:
+
+    return NumDict(default=default)
+
+
 class MutableNumDict(NumDict):
     """
     A mutable numerical dictionary.
@@ -38,6 +38,19 @@ class TestProcess(unittest.TestCase):
             }
             process.check_inputs(inputs)
 
+    @mock.patch.object(clb.Process, "_serves", clb.ConstructType.chunks)
+    def test_expected_is_refreshed_on_entrust(self):
+
+        process = clb.Process(expected=[clb.buffer("wm")])
+        self.assertEqual(process.expected, (clb.buffer("wm"),))
+
+        process.entrust(
+            (clb.agent("agent"), clb.subsystem("nacs"), clb.chunks("in"))
+        )
+        self.assertEqual(
+            process.expected, ((clb.agent("agent"), clb.buffer("wm")),)
+        )
+
 
 class TestWrappedProcess(unittest.TestCase):
     pass
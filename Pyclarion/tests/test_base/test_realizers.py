@@ -3,6 +3,26 @@ from pyClarion import numdicts as nd
 
 import unittest
 from unittest import mock
+from types import MappingProxyType
+
+
+# Expected outputs of freshly assembled structures in TestStructureMethods.
+
+NACS_EXPECTED = MappingProxyType({
+    clb.chunks("in"): nd.NumDict.empty(default=0),
+    clb.flow_tt("associative_rules"): nd.NumDict.empty(default=0),
+    clb.chunks("out"): nd.NumDict.empty(default=0),
+    clb.terminus("selection"): nd.NumDict.empty(default=0)
+})
+
+AGENT_EXPECTED = MappingProxyType({
+    clb.buffer("sensory"): nd.NumDict.empty(default=0),
+    clb.buffer("wm"): nd.NumDict.empty(default=0),
+    **{
+        (clb.subsystem("nacs"), sym): val 
+        for sym, val in NACS_EXPECTED.items()
+    }
+})
 
 
 class TestRealizerMethods(unittest.TestCase):
@@ -17,55 +37,30 @@ class TestRealizerMethods(unittest.TestCase):
             clb.Realizer(name="My Realizer")
 
 
-@mock.patch.object(clb.Process, "_serves", clb.ConstructType.basic_construct)
 class TestStructureMethods(unittest.TestCase):
 
-    def tearDown(self):
-
-        self.assertEqual(
-            clb.realizers.BUILD_CTX.get(), 
-            (), 
-            "BUILD_CTX cleanup failed."
-        )
-
-    def test_assembly_sequence_is_recorded_correctly(self):
+    @classmethod
+    def setUpClass(cls):
 
-        nacs = clb.Structure(
-            name=clb.subsystem("nacs"),
-            assets=None
-        )
-
-        with nacs:
+        cls._serves = clb.Process._serves
+        clb.Process._serves = clb.ConstructType.basic_construct
+        
+        # Several tests only inspect a fully assembled agent; it is built 
+        # once and shared. Tests must not mutate it. tearDownClass does not 
+        # run if this raises, so the patch is undone here.
+        try:
+            cls.agent, cls.nacs = cls.assemble_agent()
+        except BaseException:
+            clb.Process._serves = cls._serves
+            raise
 
-            clb.Construct(
-                name=clb.chunks("in"),
-                process=clb.Process()
-            )
+    @classmethod
+    def tearDownClass(cls):
 
-            clb.Construct(
-                name=clb.flow_tt("associative_rules"),
-                process=clb.Process()
-            )
-            clb.Construct(
-                name=clb.chunks("out"),
-                process=clb.Process()
-            )
+        clb.Process._serves = cls._serves
 
-            clb.Construct(
-                name=clb.terminus("selection"),
-                process=clb.Process()
-            )
-
-        expected = (
-            clb.chunks("in"),
-            clb.flow_tt("associative_rules"),
-            clb.chunks("out"),
-            clb.terminus("selection")
-        )
-
-        self.assertEqual(tuple(iter(nacs)), expected)
-
-    def test_assembly_sequence_is_recorded_correctly_in_nested_mode(self):
+    @staticmethod
+    def assemble_agent():
 
         agent = clb.Structure(
             name=clb.agent("agent"),
@@ -93,23 +88,109 @@ class TestStructureMethods(unittest.TestCase):
 
                 clb.Construct(
                     name=clb.chunks("in"),
-                    process=clb.Process()
+                    process=clb.Process(
+                        expected=[
+                            (
+                                clb.agent("agent"),
+                                clb.buffer("wm")
+                            )
+                        ]
+                    )
                 )
 
                 clb.Construct(
                     name=clb.flow_tt("associative_rules"),
-                    process=clb.Process()
+                    process=clb.Process(
+                        expected=[
+                            (
+                                clb.agent("agent"),
+                                clb.subsystem("nacs"),
+                                clb.chunks("in")
+                            )
+                        ]
+                    )
                 )
+
                 clb.Construct(
                     name=clb.chunks("out"),
-                    process=clb.Process()
+                    process=clb.Process(
+                        expected=[
+                            (
+                                clb.agent("agent"),
+                                clb.subsystem("nacs"),
+                                clb.chunks("in")
+                            ),
+                            (
+                                clb.agent("agent"),
+                                clb.subsystem("nacs"),
+                                clb.flow_tt("associative_rules")
+                            )
+                        ]
+                    )
                 )
 
                 clb.Construct(
                     name=clb.terminus("selection"),
-                    process=clb.Process()
+                    process=clb.Process(
+                        expected=[
+                            (
+                                clb.agent("agent"),
+                                clb.subsystem("nacs"),
+                                clb.chunks("out")
+                            )
+                        ]
+                    )
                 )
 
+        return agent, nacs
+
+    def tearDown(self):
+
+        self.assertEqual(
+            clb.realizers.BUILD_STACK.frames, 
+            [], 
+            "BUILD_STACK cleanup failed."
+        )
+
+    def test_assembly_sequence_is_recorded_correctly(self):
+
+        nacs = clb.Structure(
+            name=clb.subsystem("nacs"),
+            assets=None
+        )
+
+        with nacs:
+
+            clb.Construct(
+                name=clb.chunks("in"),
+                process=clb.Process()
+            )
+
+            clb.Construct(
+                name=clb.flow_tt("associative_rules"),
+                process=clb.Process()
+            )
+            clb.Construct(
+                name=clb.chunks("out"),
+                process=clb.Process()
+            )
+
+            clb.Construct(
+                name=clb.terminus("selection"),
+                process=clb.Process()
+            )
+
+        expected = (
+            clb.chunks("in"),
+            clb.flow_tt("associative_rules"),
+            clb.chunks("out"),
+            clb.terminus("selection")
+        )
+
+        self.assertEqual(tuple(iter(nacs)), expected)
+
+    def test_assembly_sequence_is_recorded_correctly_in_nested_mode(self):
+
         agent_expected = (
             clb.buffer("sensory"),
             clb.buffer("wm"),
@@ -123,8 +204,8 @@ class TestStructureMethods(unittest.TestCase):
             clb.terminus("selection")
         )
 
-        self.assertEqual(tuple(iter(agent)), agent_expected)
-        self.assertEqual(tuple(iter(nacs)), nacs_expected)
+        self.assertEqual(tuple(iter(self.agent)), agent_expected)
+        self.assertEqual(tuple(iter(self.nacs)), nacs_expected)
 
     def test_assembly_fails_on_missing_link_target(self):
 
@@ -158,81 +239,8 @@ class TestStructureMethods(unittest.TestCase):
         
     def test_assembly_links_constructs_correctly(self):
 
-        agent = clb.Structure(
-            name=clb.agent("agent"),
-            assets=None
-        )
-
-        with agent:
-
-            clb.Construct(
-                name=clb.buffer("wm"),
-                process=clb.Process()
-            )
-
-            nacs = clb.Structure(
-                name=clb.subsystem("nacs"),
-                assets=None
-            )
-
-            with nacs:
-
-                clb.Construct(
-                    name=clb.chunks("in"),
-                    process=clb.Process(
-                        expected=[
-                            (
-                                clb.agent("agent"),
-                                clb.buffer("wm")
-                            )
-                        ]
-                    )
-                )
-
-                clb.Construct(
-                    name=clb.flow_tt("associative_rules"),
-                    process=clb.Process(
-                        expected=[
-                            (
-                                clb.agent("agent"),
-                                clb.subsystem("nacs"),
-                                clb.chunks("in")
-                            )
-                        ]
-                    )
-                )
+        agent, nacs = self.agent, self.nacs
 
-                clb.Construct(
-                    name=clb.chunks("out"),
-                    process=clb.Process(
-                        expected=[
-                            (
-                                clb.agent("agent"),
-                                clb.subsystem("nacs"),
-                                clb.chunks("in")
-                            ),
-                            (
-                                clb.agent("agent"),
-                                clb.subsystem("nacs"),
-                                clb.flow_tt("associative_rules")
-                            )
-                        ]
-                    )
-                )
-
-                clb.Construct(
-                    name=clb.terminus("selection"),
-                    process=clb.Process(
-                        expected=[
-                            (
-                                clb.agent("agent"),
-                                clb.subsystem("nacs"),
-                                clb.chunks("out")
-                            )
-                        ]
-                    )
-                )
-        
         self.assertEqual(
             set(agent[clb.buffer("wm")].inputs),
             set()
@@ -285,67 +293,8 @@ class TestStructureMethods(unittest.TestCase):
 
     def test_structure_output_is_correctly_formed(self):
 
-        agent = clb.Structure(
-            name=clb.agent("agent"),
-            assets=None
-        )
-
-        with agent:
-
-            clb.Construct(
-                name=clb.buffer("sensory"),
-                process=clb.Process()
-            )
-
-            clb.Construct(
-                name=clb.buffer("wm"),
-                process=clb.Process()
-            )
-
-            nacs = clb.Structure(
-                name=clb.subsystem("nacs"),
-                assets=None
-            )
-
-            with nacs:
-
-                clb.Construct(
-                    name=clb.chunks("in"),
-                    process=clb.Process()
-                )
-
-                clb.Construct(
-                    name=clb.flow_tt("associative_rules"),
-                    process=clb.Process()
-                )
-                clb.Construct(
-                    name=clb.chunks("out"),
-                    process=clb.Process()
-                )
-
-                clb.Construct(
-                    name=clb.terminus("selection"),
-                    process=clb.Process()
-                )
-
-        nacs_expected = {
-            clb.chunks("in"): nd.NumDict(default=0),
-            clb.flow_tt("associative_rules"): nd.NumDict(default=0),
-            clb.chunks("out"): nd.NumDict(default=0),
-            clb.terminus("selection"): nd.NumDict(default=0)
-        }
-
-        agent_expected = {
-            clb.buffer("sensory"): nd.NumDict(default=0),
-            clb.buffer("wm"): nd.NumDict(default=0),
-            (clb.subsystem("nacs"), clb.chunks("in")): nd.NumDict(default=0),
-            (clb.subsystem("nacs"), clb.flow_tt("associative_rules")): nd.NumDict(default=0),
-            (clb.subsystem("nacs"), clb.chunks("out")): nd.NumDict(default=0),
-            (clb.subsystem("nacs"), clb.terminus("selection")): nd.NumDict(default=0)
-        }
-
-        self.assertEqual(nacs.output, nacs_expected, "failed on nacs")
-        self.assertEqual(agent.output, agent_expected, "failed on agent")
+        self.assertEqual(self.nacs.output, NACS_EXPECTED, "failed on nacs")
+        self.assertEqual(self.agent.output, AGENT_EXPECTED, "failed on agent")
         
     def test_assembly_fails_reentering_a_structure(self):
 
@@ -536,6 +485,63 @@ class TestStructureMethods(unittest.TestCase):
             
             self.assertEqual(expected, recorded)
 
+    def test_step_override_in_nested_structure_is_called(self):
+
+        recorded = []
+
+        def call_recorder(self, inputs):
+
+            recorded.append(self.client)
+
+            return nd.NumDict(default=0)
+
+        class Subsystem(clb.Structure):
+
+            def step(self):
+
+                recorded.append(self.name)
+                super().step()
+
+        with mock.patch.object(clb.Process, "call", call_recorder):
+
+            agent = clb.Structure(
+                name=clb.agent("agent"),
+                assets=None
+            )
+
+            with agent:
+
+                clb.Construct(
+                    name=clb.buffer("wm"),
+                    process=clb.Process()
+                )
+
+                nacs = Subsystem(
+                    name=clb.subsystem("nacs"),
+                    assets=None
+                )
+
+                with nacs:
+
+                    clb.Construct(
+                        name=clb.chunks("out"),
+                        process=clb.Process(
+                            expected=[
+                                (clb.agent("agent"), clb.buffer("wm"))
+                            ]
+                        )
+                    )
+
+            agent.step()
+
+            expected = [
+                (clb.agent("agent"), clb.buffer("wm")),
+                clb.subsystem("nacs"),
+                (clb.agent("agent"), clb.subsystem("nacs"), clb.chunks("out"))
+            ]
+
+            self.assertEqual(expected, recorded)
+
     def test_assembly_limited_to_2_levels_of_nesting(self):
 
         with self.assertRaises(RuntimeError):
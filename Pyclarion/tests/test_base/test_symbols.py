@@ -0,0 +1,20 @@
+import pyClarion.base as clb
+
+import unittest
+
+
+class TestInternedSymbols(unittest.TestCase):
+
+    def test_same_constructor_and_cid_return_same_instance(self):
+
+        self.assertIs(clb.chunks("in"), clb.chunks("in"))
+
+    def test_interning_is_per_constructor(self):
+
+        self.assertIsNot(clb.chunks("x"), clb.features("x"))
+
+    def test_interned_symbols_equal_plain_symbols(self):
+
+        self.assertEqual(clb.chunks("x"), clb.Symbol("chunks", "x"))
+        self.assertEqual(clb.features("x"), clb.Symbol("features", "x"))
+        self.assertNotEqual(clb.chunks("x"), clb.features("x"))
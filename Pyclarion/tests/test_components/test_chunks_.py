@@ -1,6 +1,6 @@
 from pyClarion.base import feature, chunk
 from pyClarion.components.chunks_ import Chunk
-from pyClarion.numdicts import NumDict
+from pyClarion.numdicts import NumDict, MutableNumDict
 
 import unittest
 
@@ -31,6 +31,18 @@ class TestChunkMethods(unittest.TestCase):
             (.2 * .6 + 1. * .5) / (.2 + 1.)
         )
 
+    def test_bottom_up_reflects_changes_to_mutable_strengths(self):
+
+        ch = Chunk(features={feature(1, "a"), feature(2, "a")})
+
+        strengths = MutableNumDict({feature(1, "a"): 1.0}, default=0.0)
+        self.assertAlmostEqual(ch.bottom_up(strengths), .5)
+        self.assertAlmostEqual(ch.bottom_up(NumDict(strengths, 0.0)), .5)
+
+        strengths[feature(2, "a")] = 1.0
+        self.assertAlmostEqual(ch.bottom_up(strengths), 1.)
+        self.assertAlmostEqual(ch.bottom_up(NumDict(strengths, 0.0)), 1.)
+
     def test_top_down_returns_weighted_strengths(self):
 
         features = {
@@ -1,10 +1,67 @@
 import unittest
+import random
 
 from pyClarion import rule, chunk, chunks, ConstructType
-from pyClarion.components.rules import ActionRules, Rules
+from pyClarion.components.rules import ActionRules, AssociativeRules, Rules
 from pyClarion import nd
 
 
+class TestRules(unittest.TestCase):
+
+    def test_step_applies_large_batches_of_deletions(self):
+
+        rules = Rules()
+        for i in range(100):
+            rules.define(rule(i), chunk("X"), chunk(i))
+        for i in range(0, 100, 2):
+            rules.request_del(rule(i))
+        rules.step()
+
+        self.assertEqual(set(rules), {rule(i) for i in range(1, 100, 2)})
+        self.assertEqual(len(rules.del_promises), 0)
+
+    def test_step_rejects_promised_deletions_of_missing_rules(self):
+
+        for n in (2, 100):
+            with self.subTest(n=n):
+                rules = Rules()
+                for i in range(n):
+                    rules.define(rule(i), chunk("X"), chunk(i))
+                for i in range(n):
+                    rules.request_del(rule(i))
+                del rules[rule(0)]
+
+                with self.assertRaises(KeyError):
+                    rules.step()
+                self.assertEqual(set(rules), {rule(i) for i in range(1, n)})
+
+    def test_match_finds_rules_with_same_form(self):
+
+        rules = Rules()
+        rules.define(rule("A"), chunk("X"), chunk("Y"), chunk("Z"))
+        rules.define(rule("B"), chunk("X"), chunk("Z"), chunk("Y"))
+        rules.define(rule("C"), chunk("X"), chunk("Y"))
+        rules.define(
+            rule("D"), chunk("X"), chunk("Y"), chunk("Z"), 
+            weights={chunk("Y"): .2}
+        )
+        rules.request_add(rule("E"), rules.Rule(chunk("X"), chunk("Y")))
+
+        self.assertEqual(
+            rules.match([chunk("X"), chunk("Y"), chunk("Z")]), 
+            {rule("A"), rule("B")}
+        )
+        self.assertEqual(
+            rules.match([chunk("X"), chunk("Y")]), {rule("C"), rule("E")}
+        )
+        self.assertEqual(
+            rules.match([chunk("X"), chunk("Y")], check_promises=False), 
+            {rule("C")}
+        )
+        self.assertTrue(rules.contains_form(rules[rule("D")]))
+        self.assertFalse(rules.contains_form(rules.Rule(chunk("Y"))))
+
+
 class TestActionRules(unittest.TestCase):
 
     def test_call_returns_empty_numdict_when_no_rules_exist(self):
@@ -30,6 +87,25 @@ class TestActionRules(unittest.TestCase):
 
         self.assertEqual(len(strengths), 0, msg="Unexpected items in output.")
 
+    def test_call_with_single_rule_does_not_consume_randomness(self):
+
+        rules = Rules(max_conds=1)
+        rules.define(rule("A"), chunk("Action 1"), chunk("Condition A"))
+
+        inputs = {
+            chunks(1): nd.NumDict({chunk("Condition A"): .7}, default=0)
+        }
+
+        action_rules = ActionRules(source=chunks(1), rules=rules)
+
+        random.seed(0)
+        state = random.getstate()
+        strengths = action_rules.call(inputs)
+
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(strengths[rule("A")], .7)
+        self.assertEqual(strengths[chunk("Action 1")], .7)
+
     def test_call_activates_unique_action_and_rule_pair(self):
 
         rules = Rules(max_conds=1)
@@ -129,5 +205,54 @@ class TestActionRules(unittest.TestCase):
         )
 
 
+class TestAssociativeRules(unittest.TestCase):
+
+    def test_call_propagates_max_weighted_sum_to_conclusions(self):
+
+        rules = Rules()
+        rules.define(
+            rule("A"), chunk("X"), chunk("Condition A"), chunk("Condition B")
+        )
+        rules.define(
+            rule("B"), chunk("X"), chunk("Condition C"), 
+            weights={chunk("Condition C"): .5}
+        )
+        rules.define(rule("C"), chunk("Y"), chunk("Condition D"))
+
+        inputs = {
+            chunks(1): nd.NumDict({
+                chunk("Condition A"): .7,
+                chunk("Condition B"): .2,
+                chunk("Condition C"): 1.
+            }, default=0)
+        }
+
+        associative_rules = AssociativeRules(source=chunks(1), rules=rules)
+        strengths = associative_rules.call(inputs)
+
+        self.assertAlmostEqual(strengths[rule("A")], .45)
+        self.assertAlmostEqual(strengths[rule("B")], .5)
+        self.assertAlmostEqual(strengths[chunk("X")], .5)
+        self.assertNotIn(rule("C"), strengths)
+        self.assertNotIn(chunk("Y"), strengths)
+
+    def test_call_reflects_rule_database_updates(self):
+
+        rules = Rules()
+        rules.define(rule("A"), chunk("X"), chunk("Condition A"))
+
+        inputs = {chunks(1): nd.NumDict({chunk("Condition A"): .7}, default=0)}
+        associative_rules = AssociativeRules(source=chunks(1), rules=rules)
+        associative_rules.call(inputs)
+
+        rules.request_del(rule("A"))
+        rules.request_add(rule("B"), rules.Rule(chunk("Y"), chunk("Condition A")))
+        rules.step()
+        strengths = associative_rules.call(inputs)
+
+        self.assertNotIn(rule("A"), strengths)
+        self.assertAlmostEqual(strengths[chunk("Y")], .7)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import unittest
+import random
+
+from pyClarion.components import _rules_kernels as kernels
+
+
+def make_tables(n_rules, n_conds, n_concs, seed):
+    """Return random kernel arguments for n_rules rules."""
+
+    rng = random.Random(seed)
+    col_idx, w_data, rowptr, rule_concs = [], [], [0], []
+    for _ in range(n_rules):
+        conds = rng.sample(range(n_conds), rng.randint(1, min(6, n_conds)))
+        col_idx.extend(conds)
+        w_data.extend([1 / len(conds)] * len(conds))
+        rowptr.append(len(col_idx))
+        rule_concs.append(rng.randrange(n_concs))
+    # Include cancelling strengths so that sums landing near 0 are exercised.
+    values = [.1, .2, -.3, .3, -.1, .7, 0.0]
+    s_vec = [rng.choice(values) for _ in range(n_conds)]
+
+    return (
+        kernels.vector(s_vec), 
+        kernels.table(col_idx, "int"), 
+        kernels.table(w_data), 
+        kernels.table(rowptr, "int"), 
+        kernels.table(rule_concs, "int"), 
+        n_concs
+    )
+
+
+@unittest.skipUnless(kernels.numba, "numba is not installed")
+class TestKernelParity(unittest.TestCase):
+
+    def assertKernelsAgree(self, args, active):
+
+        np = kernels.np
+        expected_concs, expected_rules = kernels._assoc_kernel(*args, active)
+        active = np.asarray(active, dtype=np.int64)
+        for kernel in (kernels._assoc_kernel_jit, kernels._assoc_kernel_par):
+            with self.subTest(kernel=kernel.__name__):
+                conc_str, rule_str = kernel(*args, active)
+                self.assertEqual(list(conc_str), list(expected_concs))
+                self.assertEqual(list(rule_str), list(expected_rules))
+
+    def test_kernels_agree_on_all_rules(self):
+
+        args = make_tables(200, 12, 10, seed=0)
+        self.assertKernelsAgree(args, range(200))
+
+    def test_kernels_agree_on_sparse_active_subset(self):
+
+        args = make_tables(200, 12, 10, seed=1)
+        self.assertKernelsAgree(args, range(3, 200, 7))
+
+    def test_kernels_agree_on_empty_active_subset(self):
+
+        args = make_tables(50, 12, 10, seed=2)
+        self.assertKernelsAgree(args, [])
+
+    def test_kernels_agree_above_parallel_threshold(self):
+
+        n = 4 * kernels.PARALLEL_THRESHOLD
+        args = make_tables(n, 40, 25, seed=3)
+        self.assertKernelsAgree(args, range(n))
+
+        # Dispatch must pick the parallel kernel here and still agree.
+        conc_str, rule_str = kernels.assoc_kernel(*args)
+        expected_concs, expected_rules = kernels._assoc_kernel(*args, None)
+        self.assertEqual(list(conc_str), list(expected_concs))
+        self.assertEqual(list(rule_str), list(expected_rules))
+
+
+if __name__ == "__main__":
+    unittest.main()
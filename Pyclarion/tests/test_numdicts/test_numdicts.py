@@ -560,6 +560,27 @@ class TestNumdictsPower(unittest.TestCase):
                                            d2[2]*math.log(d1[2]))
 
 
+class TestNumdictsConstructors(unittest.TestCase):
+    def test_empty_shares_instances_by_default(self):
+        d = nd.NumDict.empty(default=0)
+        self.assertEqual(d, nd.NumDict(default=0.0))
+        self.assertIs(d, nd.NumDict.empty(default=0.0))
+        self.assertIsNot(d, nd.NumDict.empty(default=1.0))
+
+    def test_empty_returns_new_mutable_numdicts(self):
+        d = nd.MutableNumDict.empty(default=0)
+        self.assertIsInstance(d, nd.MutableNumDict)
+        self.assertIsNot(d, nd.MutableNumDict.empty(default=0))
+
+    def test_from_sequences_matches_mapping_constructor(self):
+        d = nd.NumDict.from_sequences(("a", "b"), (1, 2.5), default=0)
+        self.assertEqual(d, nd.NumDict({"a": 1.0, "b": 2.5}, default=0.0))
+        self.assertIsInstance(d["a"], float)
+        self.assertIsInstance(
+            nd.MutableNumDict.from_sequences((), ()), nd.MutableNumDict
+        )
+
+
 class TestNumdictsOpsThreshold(unittest.TestCase):
     def test_threshold_default(self):
         d = nd.NumDict(default=5)